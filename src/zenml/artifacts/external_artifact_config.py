@@ -17,6 +17,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, PrivateAttr
 
+from zenml.enums import StackComponentType
 from zenml.logger import get_logger
 from zenml.models.v2.core.artifact import ArtifactResponse
 
@@ -84,7 +85,11 @@ class ExternalArtifactConfiguration(BaseModel):
                 "fetch the artifact ID."
             )
 
-        artifact_store_id = client.active_stack.artifact_store.id
+        # Read the artifact store ID from the stack model instead of the
+        # `active_stack` property, which would instantiate all the stack
+        # components just to access this ID.
+        components = client.active_stack_model.components
+        artifact_store_id = components[StackComponentType.ARTIFACT_STORE][0].id
         if response.artifact_store_id != artifact_store_id:
             raise RuntimeError(
                 f"The artifact {response.name} (ID: {response.id}) "
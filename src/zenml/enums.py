@@ -236,6 +236,7 @@ class GenericFilterOps(StrEnum):
     GT = "gt"
     LTE = "lte"
     LT = "lt"
+    ONEOF = "oneof"
 
 
 class SorterOps(StrEnum):
@@ -205,6 +205,8 @@ class SecretFilterModel(WorkspaceScopedFilter):
                 result = str_column_value < str_filter_value
             elif filter.operation == GenericFilterOps.LTE:
                 result = str_column_value <= str_filter_value
+            elif filter.operation == GenericFilterOps.ONEOF:
+                result = str_column_value in str_filter_value.split(",")
 
             # Exit early if the result is False for AND and True for OR
             if self.logical_operator == LogicalOperators.AND:
@@ -213,16 +213,18 @@ class BaseResponse(GenericModel, Generic[AnyBody, AnyMetadata], BaseZenModel):
                     )
 
         # Check all the fields in the body
-        for field in self.get_body().__fields__:
-            original_value = getattr(self.get_body(), field)
-            hydrated_value = getattr(hydrated_model.get_body(), field)
+        body = self.get_body()
+        hydrated_body = hydrated_model.get_body()
+        for field in body.__fields__:
+            original_value = getattr(body, field)
+            hydrated_value = getattr(hydrated_body, field)
 
             if original_value != hydrated_value:
                 if (
                     self._response_update_strategy
                     == ResponseUpdateStrategy.ALLOW
                 ):
-                    setattr(self.get_body(), field, hydrated_value)
+                    setattr(body, field, hydrated_value)
 
                     if self._warn_on_response_updates:
                         logger.warning(
@@ -177,7 +177,16 @@ class StrFilter(Filter):
 
 
 class UUIDFilter(StrFilter):
-    """Filter for all uuid fields which are mostly treated like strings."""
+    """Filter for all uuid fields which are mostly treated like strings.
+
+    In addition to the string operations, UUID fields can be filtered by a
+    comma-separated list of UUIDs using the `oneof` operation.
+    """
+
+    ALLOWED_OPS: ClassVar[List[str]] = [
+        *StrFilter.ALLOWED_OPS,
+        GenericFilterOps.ONEOF,
+    ]
 
     def generate_query_conditions_from_column(self, column: Any) -> Any:
         """Generate query conditions for a UUID column.
@@ -195,6 +204,10 @@ class UUIDFilter(StrFilter):
         if self.operation == GenericFilterOps.EQUALS:
             return column == self.value
 
+        # For membership checks, compare against all the UUIDs directly
+        if self.operation == GenericFilterOps.ONEOF:
+            return column.in_(self.value.split(","))
+
         # For all other operations, cast and handle the column as string
         return super().generate_query_conditions_from_column(
             column=cast_if(column, sqlalchemy.String)
@@ -468,7 +481,7 @@ class BaseFilter(BaseModel):
                 continue
 
             # Determine the operator and filter value
-            value, operator = cls._resolve_operator(value)
+            value, operator = cls._resolve_operator(column=key, value=value)
 
             # Define the filter
             filter = cls._define_filter(
@@ -478,16 +491,21 @@ class BaseFilter(BaseModel):
 
         return list_of_filters
 
-    @staticmethod
-    def _resolve_operator(value: Any) -> Tuple[Any, GenericFilterOps]:
+    @classmethod
+    def _resolve_operator(
+        cls, column: str, value: Any
+    ) -> Tuple[Any, GenericFilterOps]:
         """Determine the operator and filter value from a user-provided value.
 
         If the user-provided value is a string of the form "operator:value",
         then the operator is extracted and the value is returned. Otherwise,
         `GenericFilterOps.EQUALS` is used as default operator and the value
-        is returned as-is.
+        is returned as-is. The `oneof` operator is only supported for UUID
+        fields, values of other fields starting with `oneof:` are matched
+        as-is.
 
         Args:
+            column: The column to filter on.
             value: The user-provided value.
 
         Returns:
@@ -499,6 +517,10 @@ class BaseFilter(BaseModel):
             if (
                 len(split_value) == 2
                 and split_value[0] in GenericFilterOps.values()
+                and (
+                    split_value[0] != GenericFilterOps.ONEOF
+                    or cls.is_uuid_field(column)
+                )
             ):
                 value = split_value[1]
                 operator = GenericFilterOps(split_value[0])
@@ -721,6 +743,17 @@ class BaseFilter(BaseModel):
                     "Invalid value passed as UUID query parameter."
                 ) from e
 
+        # For membership checks, ensure that all values are valid UUIDs.
+        if operator == GenericFilterOps.ONEOF:
+            try:
+                for uuid_value in str(value).split(","):
+                    UUID(uuid_value)
+            except ValueError as e:
+                raise ValueError(
+                    "Invalid value passed as UUID list query parameter. "
+                    "Expected a comma-separated list of UUIDs."
+                ) from e
+
         # Cast the value to string for further comparisons.
         value = str(value)
 
@@ -14,13 +14,28 @@
 """Models representing model versions."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, Optional, Type, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Collection,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from uuid import UUID
 
 from pydantic import BaseModel, Field, PrivateAttr, validator
 
-from zenml.constants import STR_FIELD_MAX_LENGTH, TEXT_FIELD_MAX_LENGTH
-from zenml.enums import ModelStages
+from zenml.constants import (
+    PAGE_SIZE_MAXIMUM,
+    STR_FIELD_MAX_LENGTH,
+    TEXT_FIELD_MAX_LENGTH,
+)
+from zenml.enums import GenericFilterOps, ModelStages
 from zenml.models.v2.base.filter import AnyQuery
 from zenml.models.v2.base.scoped import (
     WorkspaceScopedFilter,
@@ -39,6 +54,34 @@ if TYPE_CHECKING:
 
     AnySchema = TypeVar("AnySchema", bound=BaseSchema)
 
+# Values of all model stages, used to validate stages passed as strings.
+MODEL_STAGE_VALUES: FrozenSet[str] = frozenset(
+    stage.value for stage in ModelStages
+)
+
+# Maximum number of artifact version IDs to request in a single list call.
+# This keeps the query parameters of the REST requests at a reasonable size.
+# Batches are additionally limited to `PAGE_SIZE_MAXIMUM`, so that all
+# artifact versions of a batch are returned on a single page.
+ARTIFACT_VERSION_FETCH_BATCH_SIZE = 100
+
+
+def _get_latest_version(versions: Collection[str]) -> str:
+    """Get the latest of a collection of artifact versions.
+
+    Numeric versions are compared as integers, so that e.g. version `10` is
+    considered more recent than version `9`.
+
+    Args:
+        versions: The artifact versions to compare.
+
+    Returns:
+        The latest version.
+    """
+    if all(version.isdecimal() for version in versions):
+        return max(versions, key=int)
+    return max(versions)
+
 
 # ------------------ Request Model ------------------
 
@@ -94,9 +137,7 @@ class ModelVersionUpdate(BaseModel):
     @validator("stage")
     def _validate_stage(cls, stage: str) -> str:
         stage = getattr(stage, "value", stage)
-        if stage is not None and stage not in [
-            stage.value for stage in ModelStages
-        ]:
+        if stage is not None and stage not in MODEL_STAGE_VALUES:
             raise ValueError(f"`{stage}` is not a valid model stage.")
         return stage
 
@@ -165,6 +206,12 @@ class ModelVersionResponse(
         default=None,
     )
 
+    # Latest version per artifact name, cached per artifact collection name
+    # together with the collection the versions were computed from
+    _latest_versions_by_collection: Dict[
+        str, Tuple[Dict[str, Dict[str, UUID]], Dict[str, str]]
+    ] = PrivateAttr(default_factory=dict)
+
     @property
     def stage(self) -> Optional[str]:
         """The `stage` property.
@@ -284,16 +331,17 @@ class ModelVersionResponse(
         """
         from zenml.model.model_version import ModelVersion
 
+        model = self.model
         mv = ModelVersion(
-            name=self.model.name,
-            license=self.model.license,
+            name=model.name,
+            license=model.license,
             description=self.description,
-            audience=self.model.audience,
-            use_cases=self.model.use_cases,
-            limitations=self.model.limitations,
-            trade_offs=self.model.trade_offs,
-            ethics=self.model.ethics,
-            tags=[t.name for t in self.model.tags],
+            audience=model.audience,
+            use_cases=model.use_cases,
+            limitations=model.limitations,
+            trade_offs=model.trade_offs,
+            ethics=model.ethics,
+            tags=[t.name for t in model.tags],
             version=self.name,
             was_created_in_this_run=was_created_in_this_run,
             suppress_class_validation_warnings=suppress_class_validation_warnings,
@@ -312,15 +360,7 @@ class ModelVersionResponse(
             Dictionary of model artifacts with versions as
             Dict[str, Dict[str, ArtifactResponse]]
         """
-        from zenml.client import Client
-
-        return {
-            name: {
-                version: Client().get_artifact_version(a)
-                for version, a in self.model_artifact_ids[name].items()
-            }
-            for name in self.model_artifact_ids
-        }
+        return self._get_linked_objects(self.model_artifact_ids)
 
     @property
     def data_artifacts(
@@ -332,15 +372,7 @@ class ModelVersionResponse(
             Dictionary of data artifacts with versions as
             Dict[str, Dict[str, ArtifactResponse]]
         """
-        from zenml.client import Client
-
-        return {
-            name: {
-                version: Client().get_artifact_version(a)
-                for version, a in self.data_artifact_ids[name].items()
-            }
-            for name in self.data_artifact_ids
-        }
+        return self._get_linked_objects(self.data_artifact_ids)
 
     @property
     def endpoint_artifacts(
@@ -352,15 +384,7 @@ class ModelVersionResponse(
             Dictionary of endpoint artifacts with versions as
             Dict[str, Dict[str, ArtifactResponse]]
         """
-        from zenml.client import Client
-
-        return {
-            name: {
-                version: Client().get_artifact_version(a)
-                for version, a in self.endpoint_artifact_ids[name].items()
-            }
-            for name in self.endpoint_artifact_ids
-        }
+        return self._get_linked_objects(self.endpoint_artifact_ids)
 
     @property
     def pipeline_runs(self) -> Dict[str, "PipelineRunResponse"]:
@@ -371,23 +395,98 @@ class ModelVersionResponse(
         """
         from zenml.client import Client
 
+        client = Client()
         return {
-            name: Client().get_pipeline_run(pr)
+            name: client.get_pipeline_run(pr)
             for name, pr in self.pipeline_run_ids.items()
         }
 
-    def _get_linked_object(
+    def _get_artifact_versions(
+        self, artifact_version_ids: List[UUID]
+    ) -> Dict[UUID, "ArtifactVersionResponse"]:
+        """Fetch artifact versions by ID in batches.
+
+        The artifact versions are fetched in batches instead of one by one to
+        avoid a separate round-trip per artifact version. Artifact versions
+        missing from the batched results, e.g. because the user is not
+        allowed to read them or they were deleted in the meantime, are
+        fetched individually so that the same errors are raised as when
+        fetching them one by one.
+
+        Args:
+            artifact_version_ids: The IDs of the artifact versions to fetch.
+
+        Returns:
+            Dictionary mapping the IDs to the fetched artifact versions.
+        """
+        from zenml.client import Client
+        from zenml.models.v2.core.artifact_version import (
+            ArtifactVersionFilter,
+        )
+
+        client = Client()
+        zen_store = client.zen_store
+
+        batch_size = min(ARTIFACT_VERSION_FETCH_BATCH_SIZE, PAGE_SIZE_MAXIMUM)
+        artifact_versions: Dict[UUID, "ArtifactVersionResponse"] = {}
+        for i in range(0, len(artifact_version_ids), batch_size):
+            batch = artifact_version_ids[i : i + batch_size]
+            # All artifact versions of a batch fit on a single page
+            filter_model = ArtifactVersionFilter(
+                id=f"{GenericFilterOps.ONEOF}:"
+                + ",".join(str(id_) for id_ in batch),
+                size=PAGE_SIZE_MAXIMUM,
+            )
+            page = zen_store.list_artifact_versions(filter_model)
+            artifact_versions.update({av.id: av for av in page.items})
+
+        for id_ in artifact_version_ids:
+            if id_ not in artifact_versions:
+                artifact_versions[id_] = client.get_artifact_version(id_)
+
+        return artifact_versions
+
+    def _get_linked_objects(
         self,
         collection: Dict[str, Dict[str, UUID]],
+    ) -> Dict[str, Dict[str, "ArtifactVersionResponse"]]:
+        """Get all artifacts of a collection linked to this model version.
+
+        Args:
+            collection: The collection to resolve (one of
+                self.model_artifact_ids, self.data_artifact_ids,
+                self.endpoint_artifact_ids)
+
+        Returns:
+            Dictionary of artifacts with versions as
+            Dict[str, Dict[str, ArtifactResponse]]
+        """
+        artifact_versions = self._get_artifact_versions(
+            [
+                id_
+                for versions in collection.values()
+                for id_ in versions.values()
+            ]
+        )
+        return {
+            name: {
+                version: artifact_versions[id_]
+                for version, id_ in versions.items()
+            }
+            for name, versions in collection.items()
+        }
+
+    def _get_linked_object(
+        self,
+        collection_name: str,
         name: str,
         version: Optional[str] = None,
     ) -> Optional["ArtifactVersionResponse"]:
         """Get the artifact linked to this model version given type.
 
         Args:
-            collection: The collection to search in (one of
-                self.model_artifact_ids, self.data_artifact_ids,
-                self.endpoint_artifact_ids)
+            collection_name: The name of the collection to search in (one of
+                `model`, `data` or `endpoint`)
             name: The name of the artifact to retrieve.
             version: The version of the artifact to retrieve (None for
                 latest/non-versioned)
@@ -395,15 +494,61 @@ class ModelVersionResponse(
         Returns:
             Specific version of an artifact from collection or None
         """
-        from zenml.client import Client
-
-        client = Client()
-
+        collection = self._get_collection(collection_name)
         if name not in collection:
             return None
         if version is None:
-            version = max(collection[name].keys())
-        return client.get_artifact_version(collection[name][version])
+            version = self._get_latest_versions(collection_name)[name]
+
+        from zenml.client import Client
+
+        return Client().get_artifact_version(collection[name][version])
+
+    def _get_collection(
+        self, collection_name: str
+    ) -> Dict[str, Dict[str, UUID]]:
+        """Get an artifact collection of this model version by name.
+
+        Args:
+            collection_name: The name of the collection (one of `model`,
+                `data` or `endpoint`)
+
+        Returns:
+            The collection of artifacts.
+        """
+        collection: Dict[str, Dict[str, UUID]] = getattr(
+            self, f"{collection_name}_artifact_ids"
+        )
+        return collection
+
+    def _get_latest_versions(self, collection_name: str) -> Dict[str, str]:
+        """Get the latest version of each artifact in a collection.
+
+        The result is computed once per collection and cached afterwards. If
+        the collection is replaced, for example when the body is updated
+        during hydration, the cached result is discarded.
+
+        Args:
+            collection_name: The name of the collection (one of `model`,
+                `data` or `endpoint`)
+
+        Returns:
+            Dictionary mapping artifact names to their latest version.
+        """
+        collection = self._get_collection(collection_name)
+        cached = self._latest_versions_by_collection.get(collection_name)
+        if cached is not None and cached[0] is collection:
+            return cached[1]
+
+        latest_versions = {
+            name: _get_latest_version(versions.keys())
+            for name, versions in collection.items()
+        }
+        self._latest_versions_by_collection[collection_name] = (
+            collection,
+            latest_versions,
+        )
+        return latest_versions
 
     def get_artifact(
         self,
@@ -420,12 +565,77 @@ class ModelVersionResponse(
         Returns:
             Specific version of an artifact or None
         """
-        all_artifact_ids = {
-            **self.model_artifact_ids,
-            **self.data_artifact_ids,
-            **self.endpoint_artifact_ids,
+        collection_name = self._get_collection_of_artifact(name)
+        if collection_name is None:
+            return None
+        return self._get_linked_object(collection_name, name, version)
+
+    def get_artifacts(
+        self,
+        names: List[str],
+        versions: Optional[List[Optional[str]]] = None,
+    ) -> Dict[str, Optional["ArtifactVersionResponse"]]:
+        """Get multiple artifacts linked to this model version.
+
+        All artifact versions are fetched in batches instead of one by one.
+
+        Args:
+            names: The names of the artifacts to retrieve.
+            versions: The versions of the artifacts to retrieve, in the same
+                order as the names (None for latest/non-versioned). If not
+                given, the latest version of each artifact is retrieved.
+
+        Returns:
+            Dictionary mapping the artifact names to the specific version of
+            the artifact or None
+
+        Raises:
+            ValueError: If the number of names and versions doesn't match.
+        """
+        if versions is None:
+            versions = [None] * len(names)
+        elif len(versions) != len(names):
+            raise ValueError(
+                f"Got {len(names)} artifact names but {len(versions)} "
+                "artifact versions."
+            )
+
+        artifact_version_ids: Dict[str, UUID] = {}
+        for name, version in zip(names, versions):
+            collection_name = self._get_collection_of_artifact(name)
+            if collection_name is None:
+                continue
+            if version is None:
+                version = self._get_latest_versions(collection_name)[name]
+            collection = self._get_collection(collection_name)
+            artifact_version_ids[name] = collection[name][version]
+
+        artifact_versions = self._get_artifact_versions(
+            list(artifact_version_ids.values())
+        )
+        return {
+            name: artifact_versions[artifact_version_ids[name]]
+            if name in artifact_version_ids
+            else None
+            for name in names
         }
-        return self._get_linked_object(all_artifact_ids, name, version)
+
+    def _get_collection_of_artifact(self, name: str) -> Optional[str]:
+        """Get the collection which contains the artifact of the given name.
+
+        Endpoint artifacts take precedence over data artifacts, which in turn
+        take precedence over model artifacts of the same name.
+
+        Args:
+            name: The name of the artifact.
+
+        Returns:
+            The name of the collection containing the artifact or None
+        """
+        for collection_name in ("endpoint", "data", "model"):
+            if name in self._get_collection(collection_name):
+                return collection_name
+        return None
 
     def get_model_artifact(
         self,
@@ -442,7 +652,7 @@ class ModelVersionResponse(
         Returns:
             Specific version of the model artifact or None
         """
-        return self._get_linked_object(self.model_artifact_ids, name, version)
+        return self._get_linked_object("model", name, version)
 
     def get_data_artifact(
         self,
@@ -460,7 +670,7 @@ class ModelVersionResponse(
             Specific version of the data artifact or None
         """
         return self._get_linked_object(
-            self.data_artifact_ids,
+            "data",
             name,
             version,
         )
@@ -481,7 +691,7 @@ class ModelVersionResponse(
             Specific version of the endpoint artifact or None
         """
         return self._get_linked_object(
-            self.endpoint_artifact_ids,
+            "endpoint",
             name,
             version,
         )
@@ -515,7 +725,7 @@ class ModelVersionResponse(
         from zenml.client import Client
 
         stage = getattr(stage, "value", stage)
-        if stage not in [stage.value for stage in ModelStages]:
+        if stage not in MODEL_STAGE_VALUES:
             raise ValueError(f"`{stage}` is not a valid model stage.")
 
         Client().update_model_version(
@@ -278,19 +278,21 @@ def make_dependable(cls: Type[BaseModel]) -> Callable[..., Any]:
     Returns:
         Function to use in FastAPI `Depends`.
     """
+    # Compute the signature only once instead of on every request
+    signature = inspect.signature(cls)
 
     def init_cls_and_handle_errors(*args: Any, **kwargs: Any) -> BaseModel:
         from fastapi import HTTPException
 
         try:
-            inspect.signature(init_cls_and_handle_errors).bind(*args, **kwargs)
+            signature.bind(*args, **kwargs)
             return cls(*args, **kwargs)
         except ValidationError as e:
             for error in e.errors():
                 error["loc"] = tuple(["query"] + list(error["loc"]))
             raise HTTPException(422, detail=e.errors())
 
-    init_cls_and_handle_errors.__signature__ = inspect.signature(cls)  # type: ignore[attr-defined]
+    init_cls_and_handle_errors.__signature__ = signature  # type: ignore[attr-defined]
 
     return init_cls_and_handle_errors
 
@@ -6,10 +6,13 @@ Create Date: 2023-10-18 08:07:33.374613
 
 """
 import json
+import re
+from typing import Any, Callable, Dict, Iterator, List, Pattern, Tuple
 
 from alembic import op
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import text
+from sqlalchemy.sql.elements import TextClause
 
 # revision identifiers, used by Alembic.
 revision = "729263e47b55"
@@ -17,6 +20,30 @@ down_revision = "0.45.2"
 branch_labels = None
 depends_on = None
 
+select_query_pd = text(
+    """
+    SELECT id, step_configurations
+    FROM pipeline_deployment
+    WHERE step_configurations IS NOT NULL
+    AND step_configurations LIKE :pattern
+    AND id > :last_id
+    ORDER BY id
+    LIMIT :limit
+    """
+)
+
+select_query_sr = text(
+    """
+    SELECT id, step_configuration
+    FROM step_run
+    WHERE step_configuration IS NOT NULL
+    AND step_configuration LIKE :pattern
+    AND id > :last_id
+    ORDER BY id
+    LIMIT :limit
+    """
+)
+
 update_query_pd = text(
     "UPDATE pipeline_deployment SET step_configurations = :data WHERE id = :id_"
 )
@@ -26,79 +53,203 @@ update_query_sr = text(
 )
 
 
-def upgrade() -> None:
-    """Upgrade database schema and/or data, creating a new revision."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    bind = op.get_bind()
-    session = Session(bind=bind)
-    # update pipeline_deployment
-    rows_pd = session.execute(
-        text(
-            """
-             SELECT id, step_configurations 
-             FROM pipeline_deployment 
-             WHERE step_configurations IS NOT NULL
-             """
-        )
-    )
-    for id_, data in rows_pd:
+def _dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string.
+
+    Non-ASCII characters are still escaped like in the original rows, as
+    MySQL tables created with the default `latin1` charset can't store them.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        The JSON string.
+    """
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# Matches a serialized JSON string, including escaped characters.
+_JSON_STRING = r'"(?:[^"\\]|\\.)*"'
+
+# Matches serialized external input artifacts which contain at least one
+# scalar value (the format before this migration). Values in the new format
+# are flat objects, which are skipped by the first group.
+SCALAR_EXTERNAL_ARTIFACT_REGEX = re.compile(
+    r'"external_input_artifacts"\s*:\s*\{'
+    rf"(?:\s*{_JSON_STRING}\s*:\s*\{{(?:[^{{}}\"]|{_JSON_STRING})*\}}\s*,)*"
+    rf"\s*{_JSON_STRING}\s*:\s*[^\s{{]"
+)
+
+# Matches serialized external input artifacts which contain at least one
+# object value (the format after this migration).
+OBJECT_EXTERNAL_ARTIFACT_REGEX = re.compile(
+    rf'"external_input_artifacts"\s*:\s*\{{\s*{_JSON_STRING}\s*:\s*\{{'
+)
+
+# Pattern to select only rows which mention external input artifacts. It
+# does not depend on the JSON formatting, the values are checked precisely
+# using the regular expressions above.
+LIKE_PATTERN = "%external_input_artifacts%"
+
+# Number of rows to fetch from the database in a single batch.
+FETCH_BATCH_SIZE = 1000
+
+# Number of updated rows to send to the database in a single batch.
+BATCH_SIZE = 500
+
+
+def _iter_rows(
+    session: Session, select_query: TextClause
+) -> Iterator[Tuple[str, str]]:
+    """Iterate over the rows of a query in batches.
+
+    The rows are fetched in batches ordered by ID so that only a single batch
+    is kept in memory at any time. Each batch is fetched completely before
+    it is yielded, which allows updating rows while iterating.
+
+    Args:
+        session: The session to use.
+        select_query: The select query. It has to accept the `pattern`,
+            `last_id` and `limit` parameters.
+
+    Yields:
+        The ID and JSON configuration of each row.
+    """
+    last_id = ""
+    while True:
+        rows = session.execute(
+            select_query,
+            params=dict(
+                pattern=LIKE_PATTERN,
+                last_id=last_id,
+                limit=FETCH_BATCH_SIZE,
+            ),
+        ).fetchall()
+        if not rows:
+            return
+        for id_, data in rows:
+            yield id_, data
+        last_id = rows[-1][0]
+
+
+def _flush_updates(
+    session: Session, update_query: TextClause, pending: List[Dict[str, Any]]
+) -> None:
+    """Execute all pending row updates in a single batch.
+
+    Args:
+        session: The session to use.
+        update_query: The update query to execute for each row.
+        pending: The parameters of the pending row updates. The list is
+            cleared afterwards.
+    """
+    if pending:
+        session.execute(update_query, params=pending)
+        pending.clear()
+
+
+def _wrap_artifact_ids(step_config: Dict[str, Any]) -> bool:
+    """Wrap the scalar external input artifact IDs of a step in objects.
+
+    Args:
+        step_config: The step configuration to update in place.
+
+    Returns:
+        Whether the step configuration was changed.
+    """
+    has_changes = False
+    eia = step_config.get("config", {}).get("external_input_artifacts")
+    if eia:
+        for eip_name, current in eia.items():
+            if not isinstance(current, dict):
+                eia[eip_name] = {"id": current}
+                has_changes = True
+    return has_changes
+
+
+def _unwrap_artifact_ids(step_config: Dict[str, Any]) -> bool:
+    """Replace the external input artifact objects of a step by their IDs.
+
+    Args:
+        step_config: The step configuration to update in place.
+
+    Returns:
+        Whether the step configuration was changed.
+    """
+    has_changes = False
+    eia = step_config.get("config", {}).get("external_input_artifacts")
+    if eia:
+        for eip_name, current in eia.items():
+            if isinstance(current, dict):
+                eia[eip_name] = current["id"]
+                has_changes = True
+    return has_changes
+
+
+def _migrate_step_configurations(
+    session: Session,
+    select_query: TextClause,
+    update_query: TextClause,
+    pre_filter: Pattern[str],
+    mutator: Callable[[Dict[str, Any]], bool],
+    multiple_steps: bool,
+) -> None:
+    """Apply a migration to all step configurations of a table.
+
+    Args:
+        session: The session to use.
+        select_query: The query to select the rows to migrate.
+        update_query: The query to update a single row.
+        pre_filter: Regular expression which a row has to match to be
+            migrated. Other rows are skipped without parsing them.
+        mutator: Function which updates a single step configuration in
+            place and returns whether it was changed.
+        multiple_steps: Whether each row contains a dictionary of step
+            configurations instead of a single one.
+    """
+    pending: List[Dict[str, Any]] = []
+    for id_, data in _iter_rows(session, select_query):
+        if not pre_filter.search(data):
+            continue
         try:
             data_dict = json.loads(data)
         except json.JSONDecodeError:
             continue
+        step_configs = data_dict.values() if multiple_steps else [data_dict]
         has_changes = False
-        for k in data_dict:
-            if (
-                "config" in data_dict[k]
-                and "external_input_artifacts" in data_dict[k]["config"]
-            ):
-                for eip_name in data_dict[k]["config"][
-                    "external_input_artifacts"
-                ]:
-                    current = data_dict[k]["config"][
-                        "external_input_artifacts"
-                    ][eip_name]
-                    if not isinstance(current, dict):
-                        data_dict[k]["config"]["external_input_artifacts"][
-                            eip_name
-                        ] = {"id": current}
-                        has_changes = True
+        for step_config in step_configs:
+            if mutator(step_config):
+                has_changes = True
         if has_changes:
-            data = json.dumps(data_dict)
-            session.execute(update_query_pd, params=(dict(data=data, id_=id_)))
+            pending.append(dict(data=_dumps(data_dict), id_=id_))
+            if len(pending) >= BATCH_SIZE:
+                _flush_updates(session, update_query, pending)
+    _flush_updates(session, update_query, pending)
+
 
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    # ### commands auto generated by Alembic - please adjust! ###
+    bind = op.get_bind()
+    session = Session(bind=bind)
+    # update pipeline_deployment
+    _migrate_step_configurations(
+        session,
+        select_query=select_query_pd,
+        update_query=update_query_pd,
+        pre_filter=SCALAR_EXTERNAL_ARTIFACT_REGEX,
+        mutator=_wrap_artifact_ids,
+        multiple_steps=True,
+    )
     # update step_run
-    rows_sr = session.execute(
-        text(
-            """
-             SELECT id, step_configuration 
-             FROM step_run 
-             WHERE step_configuration IS NOT NULL
-             """
-        )
+    _migrate_step_configurations(
+        session,
+        select_query=select_query_sr,
+        update_query=update_query_sr,
+        pre_filter=SCALAR_EXTERNAL_ARTIFACT_REGEX,
+        mutator=_wrap_artifact_ids,
+        multiple_steps=False,
     )
-    for id_, data in rows_sr:
-        try:
-            data_dict = json.loads(data)
-        except json.JSONDecodeError:
-            continue
-        has_changes = False
-        if (
-            "config" in data_dict
-            and "external_input_artifacts" in data_dict["config"]
-        ):
-            for eip_name in data_dict["config"]["external_input_artifacts"]:
-                current = data_dict["config"]["external_input_artifacts"][
-                    eip_name
-                ]
-                if not isinstance(current, dict):
-                    data_dict["config"]["external_input_artifacts"][
-                        eip_name
-                    ] = {"id": current}
-                    has_changes = True
-        if has_changes:
-            data = json.dumps(data_dict)
-            session.execute(update_query_sr, params=(dict(data=data, id_=id_)))
     session.commit()
     # ### end Alembic commands ###
 
@@ -109,73 +260,22 @@ def downgrade() -> None:
     bind = op.get_bind()
     session = Session(bind=bind)
     # update pipeline_deployment
-    rows = session.execute(
-        text(
-            """
-             SELECT id,step_configurations 
-             FROM pipeline_deployment 
-             WHERE step_configurations IS NOT NULL
-             """
-        )
+    _migrate_step_configurations(
+        session,
+        select_query=select_query_pd,
+        update_query=update_query_pd,
+        pre_filter=OBJECT_EXTERNAL_ARTIFACT_REGEX,
+        mutator=_unwrap_artifact_ids,
+        multiple_steps=True,
     )
-    for id_, data in rows:
-        try:
-            data_dict = json.loads(data)
-        except json.JSONDecodeError:
-            continue
-        for k in data_dict:
-            has_changes = False
-            if (
-                "config" in data_dict[k]
-                and "external_input_artifacts" in data_dict[k]["config"]
-            ):
-                for eip_name in data_dict[k]["config"][
-                    "external_input_artifacts"
-                ]:
-                    current = data_dict[k]["config"][
-                        "external_input_artifacts"
-                    ][eip_name]
-                    if isinstance(current, dict):
-                        data_dict[k]["config"]["external_input_artifacts"][
-                            eip_name
-                        ] = current["id"]
-                        has_changes = True
-        if has_changes:
-            data = json.dumps(data_dict)
-            session.execute(update_query_pd, params=(dict(data=data, id_=id_)))
-
     # update step_run
-    rows_sr = session.execute(
-        text(
-            """
-             SELECT id, step_configuration 
-             FROM step_run 
-             WHERE step_configuration IS NOT NULL
-             """
-        )
+    _migrate_step_configurations(
+        session,
+        select_query=select_query_sr,
+        update_query=update_query_sr,
+        pre_filter=OBJECT_EXTERNAL_ARTIFACT_REGEX,
+        mutator=_unwrap_artifact_ids,
+        multiple_steps=False,
     )
-    for id_, data in rows_sr:
-        try:
-            data_dict = json.loads(data)
-        except json.JSONDecodeError:
-            continue
-        has_changes = False
-        if (
-            "config" in data_dict
-            and "external_input_artifacts" in data_dict["config"]
-        ):
-            for eip_name in data_dict["config"]["external_input_artifacts"]:
-                current = data_dict["config"]["external_input_artifacts"][
-                    eip_name
-                ]
-                if isinstance(current, dict):
-                    data_dict["config"]["external_input_artifacts"][
-                        eip_name
-                    ] = current["id"]
-                    has_changes = True
-        if has_changes:
-            data = json.dumps(data_dict)
-            session.execute(update_query_sr, params=(dict(data=data, id_=id_)))
-
     session.commit()
     # ### end Alembic commands ###
@@ -3582,13 +3582,11 @@ class RestZenStore(BaseZenStore):
             raise ValueError(
                 f"Bad API Response. Expected list, got {type(body)}"
             )
-        # The initial page of items will be of type BaseResponseModel
-        page_of_items: Page[AnyResponseModel] = Page.parse_obj(body)
-        # So these items will be parsed into their correct types like here
-        page_of_items.items = [
-            response_model.parse_obj(generic_item)  # type: ignore[misc]
-            for generic_item in body["items"]
-        ]
+        # Parse the items directly into their correct types, instead of first
+        # validating them as generic response models and then parsing them
+        # again.
+        page_model = Page[response_model]  # type: ignore[valid-type]
+        page_of_items: Page[AnyResponseModel] = page_model.parse_obj(body)
         return page_of_items
 
     def _list_resources(
@@ -13,11 +13,13 @@
 #  permissions and limitations under the License.
 """SQLModel implementation of artifact table."""
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 from uuid import UUID
 
-from pydantic import ValidationError
 from sqlalchemy import TEXT, Column
 from sqlmodel import Field, Relationship
 
@@ -38,6 +40,7 @@ from zenml.models import (
     ArtifactVersionResponseBody,
     ArtifactVersionResponseMetadata,
     ArtifactVersionUpdate,
+    TagResponseModel,
 )
 from zenml.models.v2.core.artifact import ArtifactRequest
 from zenml.zen_stores.schemas.base_schemas import BaseSchema, NamedSchema
@@ -60,6 +63,79 @@ if TYPE_CHECKING:
     from zenml.zen_stores.schemas.run_metadata_schemas import RunMetadataSchema
     from zenml.zen_stores.schemas.tag_schemas import TagResourceSchema
 
+# Artifact and tag models that were already converted while converting a
+# list of artifact versions, see `cache_related_models`.
+_artifact_model_cache: ContextVar[
+    Optional[Dict[UUID, ArtifactResponse]]
+] = ContextVar("artifact_model_cache", default=None)
+_tag_model_cache: ContextVar[
+    Optional[Dict[UUID, TagResponseModel]]
+] = ContextVar("tag_model_cache", default=None)
+
+
+@contextmanager
+def cache_related_models() -> Iterator[None]:
+    """Context manager to convert each related artifact and tag only once.
+
+    Many versions of a list of artifact versions usually belong to the same
+    artifact and share the same tags. While this context manager is active,
+    each of those is only converted to a model once.
+
+    Yields:
+        None.
+    """
+    artifact_token = _artifact_model_cache.set({})
+    tag_token = _tag_model_cache.set({})
+    try:
+        yield
+    finally:
+        _tag_model_cache.reset(tag_token)
+        _artifact_model_cache.reset(artifact_token)
+
+
+def _tags_to_models(
+    tag_resources: List["TagResourceSchema"],
+) -> List[TagResponseModel]:
+    """Convert the tags of a resource to models.
+
+    Args:
+        tag_resources: The tag links of the resource.
+
+    Returns:
+        The tag models, cached if `cache_related_models` is active.
+    """
+    cache = _tag_model_cache.get()
+    if cache is None:
+        return [t.tag.to_model() for t in tag_resources]
+
+    tags = []
+    for tag_resource in tag_resources:
+        tag = cache.get(tag_resource.tag_id)
+        if tag is None:
+            tag = cache[tag_resource.tag_id] = tag_resource.tag.to_model()
+        tags.append(tag)
+    return tags
+
+
+@lru_cache(maxsize=2048)
+def _parse_source(source: str) -> Source:
+    """Parse a source stored in the database.
+
+    Most artifact versions share a small number of distinct materializers and
+    data types, so the parsed sources are cached.
+
+    Args:
+        source: The JSON representation or import path of the source.
+
+    Returns:
+        The parsed source.
+    """
+    if source.startswith("{"):
+        return Source.parse_raw(source)
+
+    # This is an old source which was an importable source path
+    return Source.from_import_path(source)
+
 
 class ArtifactSchema(NamedSchema, table=True):
     """SQL Model for artifacts."""
@@ -120,7 +196,7 @@ class ArtifactSchema(NamedSchema, table=True):
         if hydrate:
             metadata = ArtifactResponseMetadata(
                 has_custom_name=self.has_custom_name,
-                tags=[t.tag.to_model() for t in self.tags],
+                tags=_tags_to_models(self.tags),
             )
 
         return ArtifactResponse(
@@ -249,13 +325,11 @@ class ArtifactVersionSchema(BaseSchema, table=True):
         Returns:
             The converted schema.
         """
-        try:
-            version_number = int(artifact_version_request.version)
-        except ValueError:
-            version_number = None
+        version = str(artifact_version_request.version)
+        version_number = int(version) if version.isdecimal() else None
         return cls(
             artifact_id=artifact_version_request.artifact_id,
-            version=str(artifact_version_request.version),
+            version=version,
             version_number=version_number,
             artifact_store_id=artifact_version_request.artifact_store_id,
             workspace_id=artifact_version_request.workspace,
@@ -276,21 +350,12 @@ class ArtifactVersionSchema(BaseSchema, table=True):
         Returns:
             The created `ArtifactVersionResponse`.
         """
-        try:
-            materializer = Source.parse_raw(self.materializer)
-        except ValidationError:
-            # This is an old source which was an importable source path
-            materializer = Source.from_import_path(self.materializer)
-
-        try:
-            data_type = Source.parse_raw(self.data_type)
-        except ValidationError:
-            # This is an old source which was an importable source path
-            data_type = Source.from_import_path(self.data_type)
+        materializer = _parse_source(self.materializer)
+        data_type = _parse_source(self.data_type)
 
         # Create the body of the model
         body = ArtifactVersionResponseBody(
-            artifact=self.artifact.to_model(),
+            artifact=self._artifact_to_model(),
             version=self.version_number or self.version,
             user=self.user.to_model() if self.user else None,
             uri=self.uri,
@@ -318,7 +383,7 @@ class ArtifactVersionSchema(BaseSchema, table=True):
                 producer_step_run_id=producer_step_run_id,
                 visualizations=[v.to_model() for v in self.visualizations],
                 run_metadata={m.key: m.to_model() for m in self.run_metadata},
-                tags=[t.tag.to_model() for t in self.tags],
+                tags=_tags_to_models(self.tags),
             )
 
         return ArtifactVersionResponse(
@@ -327,6 +392,21 @@ class ArtifactVersionSchema(BaseSchema, table=True):
             metadata=metadata,
         )
 
+    def _artifact_to_model(self) -> ArtifactResponse:
+        """Convert the artifact of this version to a model.
+
+        Returns:
+            The artifact model, cached if `cache_related_models` is active.
+        """
+        cache = _artifact_model_cache.get()
+        if cache is None:
+            return self.artifact.to_model()
+
+        artifact = cache.get(self.artifact_id)
+        if artifact is None:
+            artifact = cache[self.artifact_id] = self.artifact.to_model()
+        return artifact
+
     def update(
         self, artifact_version_update: ArtifactVersionUpdate
     ) -> "ArtifactVersionSchema":
@@ -312,15 +312,18 @@ class ModelVersionSchema(NamedSchema, table=True):
             pipeline_run = pipeline_run_link.pipeline_run
             pipeline_run_ids[pipeline_run.name] = pipeline_run.id
 
+        # The values below are read from the database and were already
+        # validated when they were written, so we skip the (expensive)
+        # pydantic validation of the nested artifact/run mappings here.
         metadata = None
 
         if hydrate:
-            metadata = ModelVersionResponseMetadata(
+            metadata = ModelVersionResponseMetadata.construct(
                 workspace=self.workspace.to_model(),
                 description=self.description,
             )
 
-        body = ModelVersionResponseBody(
+        body = ModelVersionResponseBody.construct(
             user=self.user.to_model() if self.user else None,
             created=self.created,
             updated=self.updated,
@@ -333,11 +336,13 @@ class ModelVersionSchema(NamedSchema, table=True):
             pipeline_run_ids=pipeline_run_ids,
         )
 
-        return ModelVersionResponse(
+        # The pydantic mypy plugin types the arguments of `construct` with the
+        # unbound type variables of the generic base response class.
+        return ModelVersionResponse.construct(
             id=self.id,
             name=self.name,
-            body=body,
-            metadata=metadata,
+            body=body,  # type: ignore[arg-type]
+            metadata=metadata,  # type: ignore[arg-type]
         )
 
     def update(
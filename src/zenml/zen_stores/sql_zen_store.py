@@ -49,7 +49,7 @@ from sqlalchemy.exc import (
     NoResultFound,
     OperationalError,
 )
-from sqlalchemy.orm import noload
+from sqlalchemy.orm import joinedload, noload, selectinload
 from sqlmodel import Session, SQLModel, create_engine, or_, select
 from sqlmodel.sql.expression import Select, SelectOfScalar
 
@@ -259,6 +259,7 @@ from zenml.zen_stores.schemas import (
     UserSchema,
     WorkspaceSchema,
 )
+from zenml.zen_stores.schemas.artifact_schemas import cache_related_models
 from zenml.zen_stores.schemas.artifact_visualization_schemas import (
     ArtifactVisualizationSchema,
 )
@@ -1650,7 +1651,24 @@ class SqlZenStore(BaseZenStore):
             A list of all artifact versions matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(ArtifactVersionSchema)
+            # Load the relationships required to convert the versions to
+            # models together with the page instead of once per version
+            query = select(ArtifactVersionSchema).options(
+                joinedload(ArtifactVersionSchema.artifact),
+                joinedload(ArtifactVersionSchema.user),
+            )
+            if hydrate:
+                query = query.options(
+                    joinedload(ArtifactVersionSchema.workspace),
+                    selectinload(
+                        ArtifactVersionSchema.output_of_step_runs
+                    ).joinedload(StepRunOutputArtifactSchema.step_run),
+                    selectinload(ArtifactVersionSchema.visualizations),
+                    selectinload(ArtifactVersionSchema.run_metadata),
+                    selectinload(ArtifactVersionSchema.tags).joinedload(
+                        TagResourceSchema.tag
+                    ),
+                )
             if artifact_version_filter_model.only_unused:
                 query = query.where(
                     ArtifactVersionSchema.id.notin_(  # type: ignore[attr-defined]
@@ -1662,13 +1680,14 @@ class SqlZenStore(BaseZenStore):
                         select(StepRunInputArtifactSchema.artifact_id)
                     )
                 )
-            return self.filter_and_paginate(
-                session=session,
-                query=query,
-                table=ArtifactVersionSchema,
-                filter_model=artifact_version_filter_model,
-                hydrate=hydrate,
-            )
+            with cache_related_models():
+                return self.filter_and_paginate(
+                    session=session,
+                    query=query,
+                    table=ArtifactVersionSchema,
+                    filter_model=artifact_version_filter_model,
+                    hydrate=hydrate,
+                )
 
     def update_artifact_version(
         self,
@@ -225,7 +225,7 @@ def test_uuid_filter_model_succeeds_for_invalid_uuid_on_non_equality():
     """Test filtering with other UUID operations is possible with non-UUIDs."""
     filter_value = "a92k34"
     for filter_op in UUIDFilter.ALLOWED_OPS:
-        if filter_op == GenericFilterOps.EQUALS:
+        if filter_op in (GenericFilterOps.EQUALS, GenericFilterOps.ONEOF):
             continue
         filter_model = SomeFilterModel(
             uuid_field=f"{filter_op}:{filter_value}"
@@ -238,6 +238,39 @@ def test_uuid_filter_model_succeeds_for_invalid_uuid_on_non_equality():
         assert model_filter.column == "uuid_field"
 
 
+def test_uuid_filter_model_oneof():
+    """Test filtering for a list of UUIDs."""
+    uuid_values = [uuid.uuid4(), uuid.uuid4()]
+    filter_value = ",".join(str(uuid_value) for uuid_value in uuid_values)
+    filter_model = SomeFilterModel(
+        uuid_field=f"{GenericFilterOps.ONEOF}:{filter_value}"
+    )
+    assert len(filter_model.list_of_filters) == 1
+    model_filter = filter_model.list_of_filters[0]
+    assert isinstance(model_filter, UUIDFilter)
+    assert model_filter.operation == GenericFilterOps.ONEOF
+    assert model_filter.value == filter_value
+
+
+def test_uuid_filter_model_oneof_fails_for_invalid_uuids():
+    """Test filtering for a list of UUIDs with an invalid UUID fails."""
+    with pytest.raises(ValueError):
+        SomeFilterModel(
+            uuid_field=f"{GenericFilterOps.ONEOF}:{uuid.uuid4()},a92k34"
+        )
+
+
+def test_oneof_operator_is_ignored_for_non_uuid_fields():
+    """Test that `oneof:` values of non-UUID fields are matched as-is."""
+    filter_value = f"{GenericFilterOps.ONEOF}:a,b"
+    filter_model = SomeFilterModel(str_field=filter_value)
+    assert len(filter_model.list_of_filters) == 1
+    model_filter = filter_model.list_of_filters[0]
+    assert isinstance(model_filter, StrFilter)
+    assert model_filter.operation == GenericFilterOps.EQUALS
+    assert model_filter.value == filter_value
+
+
 def test_string_filter_model():
     """Test Filter model creation for string fields."""
     _test_filter_model(
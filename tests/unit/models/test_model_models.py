@@ -13,12 +13,13 @@
 #  permissions and limitations under the License.
 
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
 from tests.unit.steps.test_external_artifact import MockZenmlClient
+from zenml.exceptions import IllegalOperationError
 from zenml.models import (
     ModelResponse,
     ModelResponseBody,
@@ -51,6 +52,28 @@ ARTIFACT_VERSION_IDS = [uuid4(), uuid4()]
             None,
             ARTIFACT_VERSION_IDS[1],
         ),
+        (
+            {
+                "artifact": {
+                    "9": ARTIFACT_VERSION_IDS[0],
+                    "10": ARTIFACT_VERSION_IDS[1],
+                }
+            },
+            "artifact",
+            None,
+            ARTIFACT_VERSION_IDS[1],
+        ),
+        (
+            {
+                "artifact": {
+                    "2": ARTIFACT_VERSION_IDS[0],
+                    "²": ARTIFACT_VERSION_IDS[1],
+                }
+            },
+            "artifact",
+            None,
+            ARTIFACT_VERSION_IDS[1],
+        ),
         (
             {
                 "artifact": {
@@ -72,6 +95,8 @@ ARTIFACT_VERSION_IDS = [uuid4(), uuid4()]
     ids=[
         "No collision",
         "Latest version",
+        "Latest numeric version",
+        "Latest non-decimal digit version",
         "Specific version",
         "Not found",
     ],
@@ -131,3 +156,214 @@ def test_getters(
                     name=query_name,
                     version=query_version,
                 )
+
+
+def _create_model_version(workspace, **body_kwargs) -> ModelVersionResponse:
+    """Create a model version response with the given body values."""
+    model = ModelResponse(
+        id=uuid4(),
+        name="model",
+        body=ModelResponseBody(
+            created=datetime.now(),
+            updated=datetime.now(),
+            tags=[],
+        ),
+        metadata=ModelResponseMetadata(
+            workspace=workspace,
+        ),
+    )
+    return ModelVersionResponse(
+        id=uuid4(),
+        name="foo",
+        body=ModelVersionResponseBody(
+            created=datetime.now(),
+            updated=datetime.now(),
+            model=model,
+            number=-1,
+            **body_kwargs,
+        ),
+        metadata=ModelVersionResponseMetadata(
+            workspace=workspace,
+        ),
+    )
+
+
+def _mock_list_artifact_versions(mocker, artifact_versions):
+    """Mock the zen store to return the given artifact versions."""
+    mock_client = mocker.patch("zenml.client.Client")
+    list_artifact_versions = (
+        mock_client.return_value.zen_store.list_artifact_versions
+    )
+    list_artifact_versions.return_value = MagicMock(
+        index=1, total_pages=1, items=artifact_versions
+    )
+    return list_artifact_versions
+
+
+def test_latest_versions_are_updated_after_hydration(
+    sample_workspace_model, mocker
+):
+    """Test that the latest artifact versions reflect the hydrated body."""
+    new_artifact_id = uuid4()
+    hydrated_mv = _create_model_version(
+        sample_workspace_model,
+        model_artifact_ids={
+            "a": {
+                "1": ARTIFACT_VERSION_IDS[0],
+                "2": ARTIFACT_VERSION_IDS[1],
+            },
+            "b": {"1": new_artifact_id},
+        },
+    )
+    mv = hydrated_mv.copy(
+        update={
+            "body": hydrated_mv.get_body().copy(
+                update={
+                    "model_artifact_ids": {"a": {"1": ARTIFACT_VERSION_IDS[0]}}
+                }
+            ),
+            "metadata": None,
+        }
+    )
+    mock_client = mocker.patch("zenml.client.Client")
+    mock_client.return_value.zen_store.get_model_version.return_value = (
+        hydrated_mv
+    )
+    mock_client.return_value.get_artifact_version.side_effect = (
+        lambda id_: MagicMock(id=id_)
+    )
+
+    assert mv.get_model_artifact("a").id == ARTIFACT_VERSION_IDS[0]
+    assert mv.get_model_artifact("b") is None
+
+    # Hydrating the model version updates the artifact collections
+    _ = mv.description
+
+    assert mv.get_model_artifact("a").id == ARTIFACT_VERSION_IDS[1]
+    assert mv.get_model_artifact("b").id == new_artifact_id
+
+
+def test_linked_artifacts_are_fetched_in_batches(
+    sample_workspace_model, mocker
+):
+    """Test that all linked artifact versions are fetched in one list call."""
+    mv = _create_model_version(
+        sample_workspace_model,
+        model_artifact_ids={
+            "artifact": {
+                "1": ARTIFACT_VERSION_IDS[0],
+                "2": ARTIFACT_VERSION_IDS[1],
+            }
+        },
+    )
+    artifact_versions = [MagicMock(id=id_) for id_ in ARTIFACT_VERSION_IDS]
+    list_artifact_versions = _mock_list_artifact_versions(
+        mocker, artifact_versions
+    )
+
+    model_artifacts = mv.model_artifacts
+
+    list_artifact_versions.assert_called_once()
+    assert model_artifacts == {
+        "artifact": {"1": artifact_versions[0], "2": artifact_versions[1]}
+    }
+
+
+def test_artifacts_missing_from_batch_are_fetched_individually(
+    sample_workspace_model, mocker
+):
+    """Test that artifact versions missing from the list call are fetched."""
+    mv = _create_model_version(
+        sample_workspace_model,
+        model_artifact_ids={
+            "artifact": {
+                "1": ARTIFACT_VERSION_IDS[0],
+                "2": ARTIFACT_VERSION_IDS[1],
+            }
+        },
+    )
+    listed_artifact_version = MagicMock(id=ARTIFACT_VERSION_IDS[0])
+    mock_client = mocker.patch("zenml.client.Client")
+    mock_client.return_value.zen_store.list_artifact_versions.return_value = (
+        MagicMock(index=1, total_pages=1, items=[listed_artifact_version])
+    )
+    get_artifact_version = mock_client.return_value.get_artifact_version
+    get_artifact_version.side_effect = KeyError(
+        f"No artifact version with ID {ARTIFACT_VERSION_IDS[1]} found."
+    )
+
+    with pytest.raises(KeyError, match=str(ARTIFACT_VERSION_IDS[1])):
+        _ = mv.model_artifacts
+    get_artifact_version.assert_called_once_with(ARTIFACT_VERSION_IDS[1])
+
+    fetched_artifact_version = MagicMock(id=ARTIFACT_VERSION_IDS[1])
+    get_artifact_version.side_effect = None
+    get_artifact_version.return_value = fetched_artifact_version
+
+    assert mv.model_artifacts == {
+        "artifact": {
+            "1": listed_artifact_version,
+            "2": fetched_artifact_version,
+        }
+    }
+
+
+def test_get_artifacts(sample_workspace_model, mocker):
+    """Test that multiple artifacts are fetched in one list call."""
+    mv = _create_model_version(
+        sample_workspace_model,
+        model_artifact_ids={"model": {"1": ARTIFACT_VERSION_IDS[0]}},
+        data_artifact_ids={
+            "data": {
+                "1": ARTIFACT_VERSION_IDS[0],
+                "2": ARTIFACT_VERSION_IDS[1],
+            }
+        },
+    )
+    artifact_versions = [MagicMock(id=id_) for id_ in ARTIFACT_VERSION_IDS]
+    list_artifact_versions = _mock_list_artifact_versions(
+        mocker, artifact_versions
+    )
+
+    artifacts = mv.get_artifacts(
+        names=["model", "data", "missing"], versions=[None, "2", None]
+    )
+
+    list_artifact_versions.assert_called_once()
+    assert artifacts == {
+        "model": artifact_versions[0],
+        "data": artifact_versions[1],
+        "missing": None,
+    }
+
+    with pytest.raises(ValueError):
+        mv.get_artifacts(names=["model", "data"], versions=[None])
+
+
+def test_get_artifacts_with_inaccessible_artifact(
+    sample_workspace_model, mocker
+):
+    """Test that inaccessible artifacts raise the error of the single get."""
+    mv = _create_model_version(
+        sample_workspace_model,
+        data_artifact_ids={
+            "data": {"1": ARTIFACT_VERSION_IDS[0]},
+            "secret": {"1": ARTIFACT_VERSION_IDS[1]},
+        },
+    )
+    mock_client = mocker.patch("zenml.client.Client")
+    mock_client.return_value.zen_store.list_artifact_versions.return_value = (
+        MagicMock(
+            index=1,
+            total_pages=1,
+            items=[MagicMock(id=ARTIFACT_VERSION_IDS[0])],
+        )
+    )
+    get_artifact_version = mock_client.return_value.get_artifact_version
+    get_artifact_version.side_effect = IllegalOperationError(
+        "Insufficient permissions to read artifact version."
+    )
+
+    with pytest.raises(IllegalOperationError):
+        mv.get_artifacts(names=["data", "secret"])
+    get_artifact_version.assert_called_once_with(ARTIFACT_VERSION_IDS[1])
@@ -19,6 +19,7 @@ from uuid import UUID, uuid4
 import pytest
 
 from zenml.artifacts.external_artifact import ExternalArtifact
+from zenml.enums import StackComponentType
 
 GLOBAL_ARTIFACT_VERSION_ID = uuid4()
 
@@ -51,6 +52,12 @@ class MockZenmlClient:
             self.active_stack = MagicMock()
             self.active_stack.artifact_store.id = self.ARTIFACT_STORE_ID
             self.active_stack.artifact_store.path = "foo"
+            self.active_stack_model = MagicMock()
+            self.active_stack_model.components = {
+                StackComponentType.ARTIFACT_STORE: [
+                    MagicMock(id=self.ARTIFACT_STORE_ID)
+                ]
+            }
 
         def get_artifact_version(self, *args, **kwargs):
             if len(args):
@@ -0,0 +1,265 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import importlib
+import json
+from typing import Any, Dict, Iterator, Optional
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+migration = importlib.import_module(
+    "zenml.zen_stores.migrations.versions."
+    "729263e47b55_fix_external_input_artifacts"
+)
+
+ARTIFACT_IDS = [str(uuid4()) for _ in range(3)]
+
+
+def _step(external_input_artifacts: Any) -> Dict[str, Any]:
+    """Creates a step configuration with values which are hard to round-trip.
+
+    Args:
+        external_input_artifacts: The external input artifacts of the step.
+
+    Returns:
+        The step configuration.
+    """
+    return {
+        "spec": {"source": "my_module.my_step"},
+        "config": {
+            "name": "step",
+            "docstring": "Step 🚀 with ünïcödé",
+            "parameters": {
+                "nan": float("nan"),
+                "inf": float("inf"),
+                "big": 2**70,
+            },
+            "external_input_artifacts": external_input_artifacts,
+        },
+    }
+
+
+def _wrapped(name: Optional[str] = None) -> Dict[str, Any]:
+    """Creates a wrapped external input artifact.
+
+    Args:
+        name: Optional name of the artifact.
+
+    Returns:
+        The wrapped artifact.
+    """
+    return {"id": ARTIFACT_IDS[0], "name": name, "version": None}
+
+
+# Tuples of (original, expected after upgrade, expected after downgrade)
+PIPELINE_DEPLOYMENTS = [
+    (
+        {"a": _step({"x": ARTIFACT_IDS[0], "y": ARTIFACT_IDS[1]})},
+        {
+            "a": _step(
+                {"x": {"id": ARTIFACT_IDS[0]}, "y": {"id": ARTIFACT_IDS[1]}}
+            )
+        },
+        {"a": _step({"x": ARTIFACT_IDS[0], "y": ARTIFACT_IDS[1]})},
+    ),
+    # mixed object and scalar values
+    (
+        {"a": _step({"x": _wrapped("a}b{c"), "y": ARTIFACT_IDS[1]})},
+        {"a": _step({"x": _wrapped("a}b{c"), "y": {"id": ARTIFACT_IDS[1]}})},
+        {"a": _step({"x": ARTIFACT_IDS[0], "y": ARTIFACT_IDS[1]})},
+    ),
+    # scalar value only in the second step
+    (
+        {"a": _step({}), "b": _step({"x": ARTIFACT_IDS[2]})},
+        {"a": _step({}), "b": _step({"x": {"id": ARTIFACT_IDS[2]}})},
+        {"a": _step({}), "b": _step({"x": ARTIFACT_IDS[2]})},
+    ),
+    # no changes required
+    ({"a": _step({})},) * 3,
+    ({"a": {"spec": {}, "config": {"name": "a"}}},) * 3,
+]
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    """Fixture to get a session for an in-memory database with the tables.
+
+    Yields:
+        The session.
+    """
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE pipeline_deployment "
+                "(id CHAR(32) PRIMARY KEY, step_configurations TEXT)"
+            )
+        )
+        connection.execute(
+            text(
+                "CREATE TABLE step_run "
+                "(id CHAR(32) PRIMARY KEY, step_configuration TEXT)"
+            )
+        )
+    with Session(bind=engine) as session:
+        yield session
+
+
+def _insert(session: Session, table: str, column: str, data: Any) -> str:
+    """Inserts a row.
+
+    Args:
+        session: The session to use.
+        table: The table to insert the row into.
+        column: The column containing the step configuration(s).
+        data: The step configuration(s) to insert.
+
+    Returns:
+        The ID of the new row.
+    """
+    id_ = uuid4().hex
+    session.execute(
+        text(f"INSERT INTO {table} (id, {column}) VALUES (:id_, :data)"),
+        params=dict(id_=id_, data=json.dumps(data)),
+    )
+    return id_
+
+
+def _load(session: Session, table: str, column: str) -> Dict[str, str]:
+    """Loads the step configuration(s) of all rows.
+
+    Args:
+        session: The session to use.
+        table: The table to load the rows from.
+        column: The column containing the step configuration(s).
+
+    Returns:
+        The serialized step configuration(s) by row ID.
+    """
+    rows = session.execute(text(f"SELECT id, {column} FROM {table}"))
+    return {id_: data for id_, data in rows}
+
+
+def _normalize(data: str) -> str:
+    """Normalizes serialized JSON so it can be compared.
+
+    Comparing the normalized strings instead of the parsed objects also works
+    for `NaN`s and detects integers which were converted to floats.
+
+    Args:
+        data: The serialized JSON.
+
+    Returns:
+        The normalized JSON.
+    """
+    return json.dumps(json.loads(data), sort_keys=True)
+
+
+def _migrate(session: Session, upgrade: bool, multiple_steps: bool) -> None:
+    """Runs the migration for one of the tables.
+
+    Args:
+        session: The session to use.
+        upgrade: Whether to upgrade or downgrade.
+        multiple_steps: Whether to migrate the pipeline deployment or step run
+            table.
+    """
+    if multiple_steps:
+        select_query = migration.select_query_pd
+        update_query = migration.update_query_pd
+    else:
+        select_query = migration.select_query_sr
+        update_query = migration.update_query_sr
+
+    if upgrade:
+        pre_filter = migration.SCALAR_EXTERNAL_ARTIFACT_REGEX
+        mutator = migration._wrap_artifact_ids
+    else:
+        pre_filter = migration.OBJECT_EXTERNAL_ARTIFACT_REGEX
+        mutator = migration._unwrap_artifact_ids
+
+    migration._migrate_step_configurations(
+        session,
+        select_query=select_query,
+        update_query=update_query,
+        pre_filter=pre_filter,
+        mutator=mutator,
+        multiple_steps=multiple_steps,
+    )
+
+
+@pytest.mark.parametrize("multiple_steps", [True, False])
+def test_migrating_step_configurations(
+    session: Session, monkeypatch, multiple_steps: bool
+) -> None:
+    """Tests upgrading and downgrading step configurations."""
+    # Use small batches so that the rows span multiple fetch and update
+    # batches
+    monkeypatch.setattr(migration, "FETCH_BATCH_SIZE", 4)
+    monkeypatch.setattr(migration, "BATCH_SIZE", 3)
+
+    if multiple_steps:
+        table, column = "pipeline_deployment", "step_configurations"
+        cases = PIPELINE_DEPLOYMENTS * 3
+    else:
+        table, column = "step_run", "step_configuration"
+        cases = [
+            tuple(
+                list(step_configurations.values())[-1]
+                for step_configurations in case
+            )
+            for case in PIPELINE_DEPLOYMENTS * 3
+        ]
+
+    expected = {
+        _insert(session, table, column, original): (upgraded, downgraded)
+        for original, upgraded, downgraded in cases
+    }
+    invalid_id = uuid4().hex
+    session.execute(
+        text(f"INSERT INTO {table} (id, {column}) VALUES (:id_, :data)"),
+        params=dict(id_=invalid_id, data="invalid external_input_artifacts"),
+    )
+    null_id = uuid4().hex
+    session.execute(
+        text(f"INSERT INTO {table} (id) VALUES (:id_)"),
+        params=dict(id_=null_id),
+    )
+
+    _migrate(session, upgrade=True, multiple_steps=multiple_steps)
+    upgraded_rows = _load(session, table, column)
+    for id_, (upgraded, _) in expected.items():
+        assert _normalize(upgraded_rows[id_]) == _normalize(
+            json.dumps(upgraded)
+        )
+        # Non-ASCII characters stay escaped like in the original rows
+        assert upgraded_rows[id_].isascii()
+    assert upgraded_rows[invalid_id] == "invalid external_input_artifacts"
+    assert upgraded_rows[null_id] is None
+
+    # Upgrading again doesn't change anything
+    _migrate(session, upgrade=True, multiple_steps=multiple_steps)
+    assert _load(session, table, column) == upgraded_rows
+
+    _migrate(session, upgrade=False, multiple_steps=multiple_steps)
+    downgraded_rows = _load(session, table, column)
+    for id_, (_, downgraded) in expected.items():
+        assert _normalize(downgraded_rows[id_]) == _normalize(
+            json.dumps(downgraded)
+        )
+    assert downgraded_rows[invalid_id] == "invalid external_input_artifacts"
+    assert downgraded_rows[null_id] is None
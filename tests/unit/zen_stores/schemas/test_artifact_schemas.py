@@ -0,0 +1,103 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from typing import List
+from uuid import uuid4
+
+from zenml.enums import ArtifactType, TaggableResourceTypes
+from zenml.zen_stores.schemas import (
+    ArtifactSchema,
+    ArtifactVersionSchema,
+    TagResourceSchema,
+    TagSchema,
+)
+from zenml.zen_stores.schemas.artifact_schemas import (
+    _artifact_model_cache,
+    _tag_model_cache,
+    cache_related_models,
+)
+
+
+def _create_artifact_versions(count: int) -> List[ArtifactVersionSchema]:
+    """Creates versions of the same tagged artifact.
+
+    Args:
+        count: The number of versions to create.
+
+    Returns:
+        The artifact versions.
+    """
+    artifact = ArtifactSchema(name=f"artifact_{uuid4()}", has_custom_name=True)
+    tag = TagSchema(name=f"tag_{uuid4()}", color="red")
+    artifact.tags = [
+        TagResourceSchema(
+            tag=tag,
+            tag_id=tag.id,
+            resource_id=artifact.id,
+            resource_type=TaggableResourceTypes.ARTIFACT.value,
+        )
+    ]
+    return [
+        ArtifactVersionSchema(
+            version=str(i),
+            type=ArtifactType.DATA,
+            uri="",
+            materializer="module.Class",
+            data_type="module.Class",
+            artifact=artifact,
+            artifact_id=artifact.id,
+        )
+        for i in range(count)
+    ]
+
+
+def test_related_models_are_converted_once_in_cache_context(mocker):
+    """Tests that artifacts and tags are converted once per ID when cached."""
+    artifact_versions = _create_artifact_versions(3)
+    artifact_versions += _create_artifact_versions(2)
+    artifact_to_model = mocker.spy(ArtifactSchema, "to_model")
+    tag_to_model = mocker.spy(TagSchema, "to_model")
+
+    with cache_related_models():
+        for artifact_version in artifact_versions:
+            artifact_version.to_model()
+            artifact_version.artifact.to_model(hydrate=True)
+
+    # The artifacts of the versions are converted once per artifact. The
+    # hydrated artifact conversions are not cached, but reuse the converted
+    # tag of each artifact.
+    assert artifact_to_model.call_count == 2 + 5
+    assert tag_to_model.call_count == 2
+
+    # The caches are reset when leaving the context
+    assert _artifact_model_cache.get() is None
+    assert _tag_model_cache.get() is None
+
+
+def test_related_models_are_converted_every_time_without_cache(mocker):
+    """Tests that artifacts and tags are always converted without caching."""
+    artifact_versions = _create_artifact_versions(3)
+    artifact_to_model = mocker.spy(ArtifactSchema, "to_model")
+    tag_to_model = mocker.spy(TagSchema, "to_model")
+
+    with cache_related_models():
+        artifact_versions[0].to_model()
+
+    for artifact_version in artifact_versions:
+        artifact_version.to_model()
+        artifact_version.artifact.to_model(hydrate=True)
+
+    # The conversion inside the context is not reused afterwards
+    assert artifact_to_model.call_count == 1 + 3 + 3
+    assert tag_to_model.call_count == 3
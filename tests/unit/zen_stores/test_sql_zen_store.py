@@ -0,0 +1,111 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import event
+
+from zenml.client import Client
+from zenml.enums import ArtifactType
+from zenml.models import (
+    ArtifactRequest,
+    ArtifactVersionFilter,
+    ArtifactVersionRequest,
+)
+
+
+@contextmanager
+def _count_statements(client: Client) -> Iterator[List[str]]:
+    """Context manager to record the SQL statements run by the zen store.
+
+    Args:
+        client: The client whose zen store to watch.
+
+    Yields:
+        The list of statements, which is filled while the context is active.
+    """
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = client.zen_store.engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def _create_artifact_versions(client: Client, count: int) -> None:
+    """Creates tagged versions of a new artifact.
+
+    Args:
+        client: The client to use.
+        count: The number of versions to create.
+    """
+    artifact = client.zen_store.create_artifact(
+        ArtifactRequest(name=f"artifact_{count}", has_custom_name=True)
+    )
+    for version in range(count):
+        client.zen_store.create_artifact_version(
+            ArtifactVersionRequest(
+                artifact_id=artifact.id,
+                version=version + 1,
+                data_type="module.Class",
+                materializer="module.Class",
+                type=ArtifactType.DATA,
+                uri="",
+                tags=["tag"],
+                user=client.active_user.id,
+                workspace=client.active_workspace.id,
+            )
+        )
+
+
+@pytest.mark.parametrize("hydrate", [False, True])
+def test_listing_artifact_versions_eager_loads_relationships(
+    clean_client: Client, hydrate: bool
+) -> None:
+    """Tests that listing artifact versions doesn't load rows one by one."""
+    _create_artifact_versions(clean_client, 2)
+    with _count_statements(clean_client) as statements:
+        page = clean_client.zen_store.list_artifact_versions(
+            ArtifactVersionFilter(), hydrate=hydrate
+        )
+        if hydrate:
+            for artifact_version in page.items:
+                _ = artifact_version.tags
+    assert page.total == 2
+    statement_count = len(statements)
+
+    _create_artifact_versions(clean_client, 8)
+    with _count_statements(clean_client) as statements:
+        page = clean_client.zen_store.list_artifact_versions(
+            ArtifactVersionFilter(), hydrate=hydrate
+        )
+        if hydrate:
+            for artifact_version in page.items:
+                _ = artifact_version.tags
+    assert page.total == 10
+
+    # The relationships of all versions on the page are loaded together, so
+    # the number of statements doesn't grow with the number of versions. The
+    # plain list only runs the count and page queries. The hydrated list
+    # additionally loads each relationship once and the links of the shared
+    # tag to compute its tagged count.
+    assert len(statements) == statement_count
+    assert statement_count <= (7 if hydrate else 2)